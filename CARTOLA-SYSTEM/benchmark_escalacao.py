@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ Benchmark da Escalação - Guloso (3 estratégias) x Otimizador Exato
+
+Gera um mercado sintético do tamanho do real (~800 atletas) e compara score
+total e tempo de execução das duas abordagens para vários orçamentos. No fim,
+mede a simulação Monte Carlo das melhores escalações.
+
+Antes das medições, o otimizador exato é conferido contra força bruta em
+mercados pequenos e os perfis de pesos são conferidos na escalação (o script
+aborta se alguma conferência falhar).
+
+Uso:
+  python benchmark_escalacao.py [--atletas 800] [--rodadas 5] [--seed 42]
+                                [--escalacoes 36] [--simulacoes 100000] [--processos N]
+                                [--verificacoes 300]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import itertools
+import importlib.util
+from importlib.machinery import SourceFileLoader
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+CAMINHO_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CARTOLA.PY")
+
+
+def carregar_app():
+    """Importa o CARTOLA.PY como módulo (extensão maiúscula não é importável direto)"""
+    loader = SourceFileLoader("cartola_app", CAMINHO_APP)
+    spec = importlib.util.spec_from_loader("cartola_app", loader)
+    modulo = importlib.util.module_from_spec(spec)
+    # Registrado em sys.modules para o pickle achar as funções (ProcessPoolExecutor)
+    sys.modules["cartola_app"] = modulo
+    loader.exec_module(modulo)
+    return modulo
+
+
+# Distribuição de um elenco típico por posição
+ELENCO_POSICOES = {1: 3, 2: 5, 3: 6, 4: 10, 5: 6, 6: 1}
+
+
+def gerar_mercado(app, total_atletas=800, seed=42, total_clubes=20):
+    """Gera atletas, clubes e partidas sintéticos com a estrutura da API
+
+    Os primeiros clubes vêm do FORCA_TIMES; acima disso são criados clubes
+    genéricos (força padrão do AnalisadorConfronto).
+    """
+    rng = random.Random(seed)
+    clubes_ids = list(app.FORCA_TIMES.keys())[:total_clubes]
+    clubes_ids += [10000 + i for i in range(total_clubes - len(clubes_ids))]
+    nomes = {c: app.FORCA_TIMES[c]["nome"] if c in app.FORCA_TIMES else f"Clube {c}" for c in clubes_ids}
+    clubes = {str(c): {"nome": nomes[c], "abreviacao": nomes[c][:3].upper()} for c in clubes_ids}
+
+    partidas = []
+    embaralhados = clubes_ids[:]
+    rng.shuffle(embaralhados)
+    for i in range(0, len(embaralhados) - 1, 2):
+        partidas.append({"clube_casa_id": embaralhados[i], "clube_visitante_id": embaralhados[i + 1]})
+
+    posicoes = [p for p, qtd in ELENCO_POSICOES.items() for _ in range(qtd)]
+    atletas = []
+    for atleta_id in range(1, total_atletas + 1):
+        preco = round(min(max(rng.lognormvariate(1.8, 0.6), 1.0), 30.0), 2)
+        media = round(max(rng.gauss(preco * 0.45, 1.5), 0.0), 2)
+        atletas.append({
+            "atleta_id": atleta_id,
+            "apelido": f"Atleta {atleta_id}",
+            "posicao_id": rng.choice(posicoes),
+            "clube_id": rng.choice(clubes_ids),
+            "status_id": rng.choices([7, 2, 3, 5, 6], weights=[60, 10, 5, 10, 15])[0],
+            "preco_num": preco,
+            "media_num": media,
+            "variacao_num": round(rng.uniform(-3, 3), 2),
+            "jogos_num": rng.randint(0, 38),
+        })
+    return atletas, clubes, partidas
+
+
+def melhores_forca_bruta(atletas, esquema, cartoletas, quantidade):
+    """Scores das N melhores escalações testando todas as combinações"""
+    grupos = []
+    for pos_id, qtd in esquema.items():
+        atletas_pos = [a for a in atletas if a["posicao_id"] == pos_id]
+        grupos.append(list(itertools.combinations(atletas_pos, qtd)))
+    totais = []
+    for escolha in itertools.product(*grupos):
+        escalados = [a for grupo in escolha for a in grupo]
+        if sum(a["preco_num"] for a in escalados) <= cartoletas + 1e-9:
+            totais.append(sum(a["score"] for a in escalados))
+    return sorted(totais, reverse=True)[:quantidade]
+
+
+def verificar_otimizador(app, casos=300, seed=42):
+    """Confere o OtimizadorEscalacao contra força bruta em mercados pequenos"""
+    rng = random.Random(seed)
+    for caso in range(casos):
+        esquema = {1: 1, 2: rng.randint(1, 2), 3: 1, 4: rng.randint(1, 2)}
+        atletas = [{
+            "atleta_id": i,
+            "posicao_id": rng.choice(list(esquema)),
+            "preco_num": round(rng.uniform(1, 15), 2),
+            "score": round(rng.uniform(0, 10), 2),
+        } for i in range(rng.randint(8, 14))]
+        cartoletas = round(rng.uniform(5, 50), 2)
+        if caso % 2:
+            # Orçamento a menos de meio centavo do custo de um time: testa o arredondamento
+            escalados = []
+            for pos_id, qtd in esquema.items():
+                atletas_pos = [a for a in atletas if a["posicao_id"] == pos_id]
+                escalados += rng.sample(atletas_pos, min(qtd, len(atletas_pos)))
+            cartoletas = round(sum(a["preco_num"] for a in escalados) + rng.uniform(-0.005, 0.005), 4)
+        quantidade = rng.randint(1, 3)
+
+        esperado = melhores_forca_bruta(atletas, esquema, cartoletas, quantidade)
+        obtido = app.OtimizadorEscalacao(atletas, esquema, cartoletas).otimizar(quantidade)
+        scores = [score for _, _, score in obtido]
+        assert len(scores) == len(esperado) and all(abs(a - b) < 1e-6 for a, b in zip(scores, esperado)), (
+            f"caso {caso}: otimizador {scores} != força bruta {esperado} (C$ {cartoletas})")
+        for escalados, gasto, _ in obtido:
+            assert gasto <= cartoletas + 1e-9, f"caso {caso}: gasto {gasto} acima de C$ {cartoletas}"
+            assert len({a["atleta_id"] for a in escalados}) == sum(esquema.values())
+    return casos
+
+
+def verificar_pesos(app, atletas, clubes, partidas, cartoletas=120.0):
+    """Perfis de pesos diferentes precisam chegar ao otimizador (com e sem tabela colunar)"""
+    perfis = (app.PESOS_OPCOES[1], app.PESOS_OPCOES[2])  # Máxima Pontuação x Custo-Benefício
+    for tabela in (app.TabelaAtletas(atletas, partidas), None):
+        escalador = app.EscaladorInteligente(atletas, clubes, partidas, cartoletas, tabela)
+        escalacoes = []
+        for pesos in perfis:
+            escalacao, _ = escalador.escalar_time(pesos=pesos)
+            for atleta in escalacao:
+                esperado = escalador.calcular_score(atleta, pesos)
+                assert abs(atleta["score"] - esperado) < 1e-6, (
+                    f"score de {atleta['apelido']} = {atleta['score']}, esperado {esperado} com os pesos do perfil")
+            escalacoes.append({a["atleta_id"] for a in escalacao})
+        assert escalacoes[0] != escalacoes[1], "perfis de pesos diferentes geraram a mesma escalação"
+
+
+def cronometrar(funcao, repeticoes):
+    """Retorna (resultado, melhor tempo em ms)"""
+    melhor = float("inf")
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return resultado, melhor * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da escalação automática")
+    parser.add_argument("--atletas", type=int, default=800)
+    parser.add_argument("--rodadas", type=int, default=5, help="repetições por medição")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--escalacoes", type=int, default=36, help="escalações simuladas")
+    parser.add_argument("--simulacoes", type=int, default=100000, help="rodadas simuladas por escalação")
+    parser.add_argument("--processos", type=int, default=None, help="processos da simulação (padrão: CPUs)")
+    parser.add_argument("--verificacoes", type=int, default=300, help="casos conferidos contra força bruta")
+    args = parser.parse_args()
+
+    app = carregar_app()
+    if args.verificacoes:
+        casos = verificar_otimizador(app, args.verificacoes, args.seed)
+        print(f"✅ Otimizador exato confere com força bruta em {casos} mercados pequenos")
+    atletas, clubes, partidas = gerar_mercado(app, args.atletas, args.seed)
+    if args.verificacoes:
+        verificar_pesos(app, atletas, clubes, partidas)
+        print("✅ Pesos da prioridade mudam a escalação (tabela colunar e cálculo por atleta)")
+
+    print("=" * 78)
+    print(f"⏱️ BENCHMARK ESCALAÇÃO - {len(atletas)} atletas, {len(partidas)} partidas")
+    print("=" * 78)
+    print(f"{'Orçamento':>10} | {'Guloso':>16} | {'Exato':>16} | {'Ganho':>8} | {'Top-5 (ms)':>10}")
+    print("-" * 78)
+
+    for cartoletas in (60.0, 80.0, 100.0, 120.0, 150.0):
+        escalador = app.EscaladorInteligente(atletas, clubes, partidas, cartoletas)
+
+        (gul, _), t_gul = cronometrar(lambda: escalador._escalar_guloso(), args.rodadas)
+        (exa, _), t_exa = cronometrar(lambda: escalador.escalar_time(), args.rodadas)
+        _, t_top = cronometrar(lambda: escalador.escalar_melhores(5), args.rodadas)
+
+        s_gul = sum(a["score"] for a in gul)
+        s_exa = sum(a["score"] for a in exa)
+        print(f"C$ {cartoletas:>7.2f} | {s_gul:>7.2f} ({len(gul):>2}) {t_gul:>4.0f}ms | "
+              f"{s_exa:>7.2f} ({len(exa):>2}) {t_exa:>4.0f}ms | {s_exa - s_gul:>+8.2f} | {t_top:>10.1f}")
+
+    print("-" * 78)
+    print("Tempos incluem o cálculo de score de todos os atletas aptos (igual ao app).")
+
+    # ===== MONTE CARLO =====
+    escalador = app.EscaladorInteligente(atletas, clubes, partidas, 120.0)
+    escalacoes = [atletas_esc for atletas_esc, _, _ in escalador.escalar_melhores(args.escalacoes)]
+    simulador = app.SimuladorMonteCarlo(partidas, seed=args.seed, processos=args.processos)
+    try:
+        simulador.simular(escalacoes[:1], simulacoes=simulador.TAMANHO_BLOCO)  # Sobe os processos
+        resultados, t_sim = cronometrar(lambda: simulador.simular(escalacoes, simulacoes=args.simulacoes), 1)
+    finally:
+        simulador.fechar()
+
+    print()
+    print(f"🎲 MONTE CARLO - {len(escalacoes)} escalações x {args.simulacoes} rodadas "
+          f"({simulador.processos} processo(s)): {t_sim:.0f}ms")
+    print(f"{'#':>3} | {'Score':>7} | {'Média':>7} | {'Desvio':>7} | {'P5':>7} | {'P50':>7} | {'P95':>7}")
+    for i, (escalacao, r) in enumerate(zip(escalacoes[:10], resultados), 1):
+        score = sum(a["score"] for a in escalacao)
+        print(f"{i:>3} | {score:>7.2f} | {r['media']:>7.2f} | {r['desvio']:>7.2f} | "
+              f"{r['p5']:>7.2f} | {r['p50']:>7.2f} | {r['p95']:>7.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ Benchmark da Interface - Tabelas do mercado, escalação e reservas
+
+Abre a janela principal sem tela (QT_QPA_PLATFORM=offscreen), carrega um
+mercado sintético grande e mede o tempo de cada atualização das tabelas, a
+memória do processo (RSS) e quantos objetos Qt ficam vivos na janela.
+
+Uso:
+  python benchmark_interface.py [--atletas 5000] [--rodadas 20] [--seed 42]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+from benchmark_escalacao import carregar_app, gerar_mercado
+
+
+def memoria_mb():
+    """RSS atual do processo em MB (Linux: /proc/self/statm)"""
+    try:
+        with open("/proc/self/statm") as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, IndexError):
+        return float("nan")
+
+
+def mostrar_aba(janela, widget):
+    """Deixa visível a aba que contém o widget (tabela escondida não é pintada)"""
+    for indice in range(janela.tabs.count()):
+        if janela.tabs.widget(indice).isAncestorOf(widget):
+            janela.tabs.setCurrentIndex(indice)
+            return
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das tabelas da interface")
+    parser.add_argument("--atletas", type=int, default=5000)
+    parser.add_argument("--rodadas", type=int, default=20, help="atualizações medidas por cenário")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    app = carregar_app()
+    from PyQt5.QtWidgets import QApplication, QProgressBar
+    from PyQt5.QtCore import Qt, QObject
+
+    class JanelaBenchmark(app.CartolaFCManager):
+        def carregar_dados(self):
+            """Sem a carga automática da API: o benchmark injeta o mercado sintético"""
+
+    qt_app = QApplication.instance() or QApplication(sys.argv)
+    janela = JanelaBenchmark()
+    janela.cache_imagens.ativo = False  # Sem rede: mede só tabela e pintura
+    janela.resize(1400, 900)
+    janela.show()
+    qt_app.processEvents()
+
+    atletas, clubes, partidas = gerar_mercado(app, args.atletas, args.seed)
+    dados = {
+        "status": {"rodada_atual": 1, "status_mercado": 1},
+        "clubes": clubes,
+        "mercado": {"atletas": atletas},
+        "partidas": {"partidas": partidas},
+    }
+
+    memoria_inicial = memoria_mb()
+    janela.progress = QProgressBar()
+    inicio = time.perf_counter()
+    janela.dados_carregados(dados)
+    qt_app.processEvents()
+    t_carga = (time.perf_counter() - inicio) * 1000
+
+    # Cenários de filtro: sem filtro (mercado inteiro), cada posição e uma busca por nome
+    janela.chk_provaveis.setChecked(False)
+    mostrar_aba(janela, janela.tabela_mercado)
+    qt_app.processEvents()
+    cenarios = [("Mercado inteiro", lambda: None)]
+    for indice in range(1, janela.combo_posicao.count()):
+        cenarios.append((f"Posição {janela.combo_posicao.itemText(indice)}",
+                         lambda i=indice: janela.combo_posicao.setCurrentIndex(i)))
+
+    print("=" * 70)
+    print(f"⏱️ BENCHMARK INTERFACE - {len(atletas)} atletas")
+    print("=" * 70)
+    print(f"Carga inicial (dados_carregados): {t_carga:.0f}ms")
+
+    tempos = []
+    for _ in range(args.rodadas):
+        for _, aplicar in cenarios:
+            janela.combo_posicao.blockSignals(True)
+            janela.combo_posicao.setCurrentIndex(0)
+            aplicar()
+            janela.combo_posicao.blockSignals(False)
+            inicio = time.perf_counter()
+            janela.filtrar_mercado()
+            qt_app.processEvents()  # Inclui a pintura da parte visível
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    print(f"filtrar_mercado: mediana {tempos[len(tempos) // 2]:.1f}ms | "
+          f"p95 {tempos[int(len(tempos) * 0.95)]:.1f}ms | máx {tempos[-1]:.1f}ms")
+
+    # Ordenação pelo cabeçalho com o mercado inteiro na tabela
+    janela.combo_posicao.setCurrentIndex(0)
+    janela.filtrar_mercado()
+    tempos = []
+    for _ in range(args.rodadas):
+        for coluna in (0, 4, 5, 8, 9):
+            inicio = time.perf_counter()
+            janela.tabela_mercado.sortByColumn(coluna, Qt.AscendingOrder)
+            qt_app.processEvents()
+            tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    print(f"ordenar pelo cabeçalho: mediana {tempos[len(tempos) // 2]:.1f}ms | máx {tempos[-1]:.1f}ms")
+    janela.tabela_mercado.sortByColumn(8, Qt.DescendingOrder)
+
+    mostrar_aba(janela, janela.tabela_escalacao)
+    qt_app.processEvents()
+
+    inicio = time.perf_counter()
+    for _ in range(args.rodadas):
+        janela.escalar_automaticamente()
+        qt_app.processEvents()
+    t_escalar = (time.perf_counter() - inicio) * 1000 / args.rodadas
+    print(f"escalar_automaticamente (com reservas e campo): {t_escalar:.1f}ms")
+
+    print(f"Memória (RSS): {memoria_inicial:.0f}MB -> {memoria_mb():.0f}MB")
+    print(f"Objetos Qt na janela: {len(janela.findChildren(QObject))}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,586 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ Benchmark do Pipeline - Cartola (app) + Sincronizador de salas ao vivo
+
+Roda tudo sem tela e sem rede: servidores HTTP locais fazem o papel da API do
+Cartola, da Football-Data e do PostgREST (Supabase), servindo um mercado
+sintético (ou respostas gravadas, --fixtures). Mede cada etapa:
+
+  load       ClienteCartola.carregar (cache frio e revalidação 304) + histórico
+  normalize  normalização dos atletas, TabelaAtletas e IndiceMercado
+  score      calcular_score atleta a atleta e TabelaAtletas (todos os perfis)
+  optimize   escalar_time e escalar_automaticamente (com reservas e campo)
+  filter     filtrar_mercado em vários cenários de filtro
+  sync       fetch_fixtures + bulk_sync_to_supabase (cheio e diff) + modo individual
+
+Os ganchos de perfil do app (PERFIL) e do sincronizador (PROFILER) ficam
+ligados durante o benchmark e seus tempos/contadores entram no relatório.
+
+Uso:
+  python benchmark_pipeline.py [--atletas 800] [--clubes 20] [--rodadas 5] [--seed 42]
+                               [--historico 10] [--jogos 40] [--latencia 0]
+                               [--fixtures DIR] [--gravar-fixtures DIR]
+                               [--saida resultado.json] [--comparar base.json] [--tolerancia 0.25]
+
+Com --comparar, etapas mais lentas que a base além da tolerância são listadas
+e o processo sai com código 1 (para rodar no CI).
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import asyncio
+import hashlib
+import argparse
+import tempfile
+import threading
+import contextlib
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from benchmark_escalacao import carregar_app, gerar_mercado
+
+RAIZ_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ETAPAS = ("load", "normalize", "score", "optimize", "filter", "sync")
+
+
+# ====================== SERVIDORES STUB ======================
+class ServidorStub:
+    """
+    Servidor HTTP local numa thread
+
+    responder(metodo, caminho, query, corpo) -> (status, payload, headers);
+    payload pode ser bytes (já serializado) ou qualquer coisa serializável em JSON.
+    GETs com 200 ganham ETag e respondem 304 ao If-None-Match igual.
+    """
+
+    def __init__(self, responder, latencia_ms=0):
+        self.responder = responder
+        self.latencia = latencia_ms / 1000
+        self.requisicoes = 0
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Cabeçalho e corpo saem em escritas separadas: sem isso o Nagle + ACK
+            # atrasado somam ~40ms por requisição e o benchmark mede o stub
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _atender(self, metodo):
+                servidor.requisicoes += 1
+                if servidor.latencia:
+                    time.sleep(servidor.latencia)
+                partes = urlsplit(self.path)
+                tamanho = int(self.headers.get("Content-Length") or 0)
+                corpo = json.loads(self.rfile.read(tamanho)) if tamanho else None
+                status, payload, headers = servidor.responder(
+                    metodo, partes.path, parse_qs(partes.query), corpo
+                )
+                dados = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+                if metodo == "GET" and status == 200:
+                    etag = '"%s"' % hashlib.md5(dados).hexdigest()
+                    headers = dict(headers or {}, ETag=etag)
+                    if self.headers.get("If-None-Match") == etag:
+                        status, dados = 304, b""
+                self.send_response(status)
+                for chave, valor in (headers or {}).items():
+                    self.send_header(chave, valor)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(dados)))
+                self.end_headers()
+                self.wfile.write(dados)
+
+            def do_GET(self):
+                self._atender("GET")
+
+            def do_POST(self):
+                self._atender("POST")
+
+            def do_PATCH(self):
+                self._atender("PATCH")
+
+            def do_DELETE(self):
+                self._atender("DELETE")
+
+        self.http = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.http.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.http.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.http.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.http.shutdown()
+        self.http.server_close()
+
+
+class RotasEstaticas:
+    """Responder de rotas fixas (GET caminho -> JSON), com o corpo serializado uma vez"""
+
+    def __init__(self, rotas):
+        self.rotas = {caminho: json.dumps(payload).encode("utf-8") for caminho, payload in rotas.items()}
+
+    def __call__(self, metodo, caminho, query, corpo):
+        if metodo != "GET" or caminho not in self.rotas:
+            return 404, {"mensagem": f"rota {caminho} não gravada"}, None
+        return 200, self.rotas[caminho], None
+
+    def gravar(self, pasta):
+        """Salva cada rota como arquivo (formato aceito por --fixtures)"""
+        os.makedirs(pasta, exist_ok=True)
+        for caminho, dados in self.rotas.items():
+            with open(os.path.join(pasta, arquivo_fixture(caminho)), "wb") as f:
+                f.write(dados)
+
+
+def arquivo_fixture(caminho):
+    """/atletas/mercado -> atletas_mercado.json"""
+    return caminho.strip("/").replace("/", "_") + ".json"
+
+
+def carregar_fixtures(pasta, rotas):
+    """Troca o payload das rotas que tiverem resposta gravada na pasta"""
+    trocadas = 0
+    for caminho in list(rotas):
+        arquivo = os.path.join(pasta, arquivo_fixture(caminho))
+        if os.path.exists(arquivo):
+            with open(arquivo, "r", encoding="utf-8") as f:
+                rotas[caminho] = json.load(f)
+            trocadas += 1
+    return trocadas
+
+
+class PostgRESTStub:
+    """
+    Tabela game_rooms em memória com o subconjunto do PostgREST que o
+    sincronizador usa: eq./in./is.null nos filtros, select, upsert com
+    on_conflict (sala pública = private_code nulo), PATCH por id e DELETE.
+    """
+
+    STATUS_VALIDOS = ("scheduled", "live", "halftime", "finished", "cancelled")
+
+    def __init__(self):
+        self.linhas = {}  # fixture_id -> linha (só salas públicas)
+        self.proximo_id = 1
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _filtro(query, campo):
+        valor = query.get(campo, [None])[0]
+        if valor is None:
+            return None
+        if valor.startswith("eq."):
+            return {int(valor[3:])}
+        if valor.startswith("in.("):
+            return {int(v) for v in valor[4:-1].split(",") if v}
+        return None
+
+    def _selecionar(self, query, linhas):
+        colunas = query.get("select", ["*"])[0]
+        if colunas == "*":
+            return [dict(linha) for linha in linhas]
+        colunas = colunas.split(",")
+        return [{c: linha.get(c) for c in colunas} for linha in linhas]
+
+    def _gravar(self, linha):
+        atual = self.linhas.get(linha["fixture_id"])
+        if atual is None:
+            atual = self.linhas[linha["fixture_id"]] = {"id": self.proximo_id}
+            self.proximo_id += 1
+        atual.update(linha)
+
+    def __call__(self, metodo, caminho, query, corpo):
+        if caminho != "/rest/v1/game_rooms":
+            return 404, {"message": "tabela desconhecida"}, None
+
+        with self._lock:
+            if metodo == "GET":
+                ids = self._filtro(query, "fixture_id")
+                linhas = [l for f, l in self.linhas.items() if ids is None or f in ids]
+                return 200, self._selecionar(query, linhas), None
+
+            if metodo == "POST":
+                lote = corpo if isinstance(corpo, list) else [corpo]
+                if any(l.get("status") not in self.STATUS_VALIDOS for l in lote):
+                    return 400, {"message": "violates check constraint game_rooms_status_check"}, None
+                if "on_conflict" in query and len({l["fixture_id"] for l in lote}) != len(lote):
+                    return 500, {"message": "ON CONFLICT DO UPDATE command cannot affect row a second time"}, None
+                for linha in lote:
+                    self._gravar(linha)
+                return 201, b"", None
+
+            if metodo == "PATCH":
+                ids = self._filtro(query, "id")
+                for linha in self.linhas.values():
+                    if ids and linha["id"] in ids:
+                        linha.update(corpo)
+                return 204, b"", None
+
+            if metodo == "DELETE":
+                ids = self._filtro(query, "fixture_id") or set()
+                for fixture_id in ids:
+                    self.linhas.pop(fixture_id, None)
+                return 204, b"", None
+
+        return 405, {"message": "método não suportado"}, None
+
+
+# ====================== DADOS SINTÉTICOS ======================
+def gerar_api_cartola(app, args):
+    """Rotas da API do Cartola para o mercado sintético (status, mercado, partidas, histórico)"""
+    atletas, clubes, partidas = gerar_mercado(app, args.atletas, args.seed, args.clubes)
+    rng = random.Random(args.seed + 1)
+    rodada_atual = args.historico + 1
+
+    rotas = {
+        "/mercado/status": {"rodada_atual": rodada_atual, "status_mercado": 1, "temporada": 2026},
+        "/clubes": clubes,
+        "/atletas/mercado": {"atletas": atletas, "clubes": clubes},
+        "/partidas": {"partidas": partidas, "rodada": rodada_atual},
+        f"/partidas/{rodada_atual}": {"partidas": partidas, "rodada": rodada_atual},
+        "/rodadas": [{"rodada_id": r} for r in range(1, 39)],
+        "/atletas/pontuados": {"atletas": {}, "rodada": args.historico},
+    }
+
+    # Rodadas encerradas para o histórico local (pontuados + placar oficial)
+    for rodada in range(1, rodada_atual):
+        placares = []
+        for partida in partidas:
+            placares.append(dict(partida, placar_oficial_mandante=rng.randint(0, 4),
+                                 placar_oficial_visitante=rng.randint(0, 3), valida=True))
+        pontuados = {}
+        for atleta in atletas:
+            if rng.random() < 0.6:
+                pontuados[str(atleta["atleta_id"])] = {
+                    "clube_id": atleta["clube_id"],
+                    "posicao_id": atleta["posicao_id"],
+                    "pontuacao": round(rng.gauss(atleta["media_num"], 3), 2),
+                    "scout": {"DS": rng.randint(0, 4), "FS": rng.randint(0, 3), "FC": rng.randint(0, 3)},
+                    "entrou_em_campo": True,
+                }
+        rotas[f"/partidas/{rodada}"] = {"partidas": placares, "rodada": rodada}
+        rotas[f"/atletas/pontuados/{rodada}"] = {"atletas": pontuados, "rodada": rodada}
+    return rotas
+
+
+STATUS_FOOTBALL_DATA = ["SCHEDULED", "TIMED", "IN_PLAY", "PAUSED", "FINISHED", "POSTPONED"]
+
+
+def gerar_api_football_data(ligas, jogos_por_liga, seed, rodada=0):
+    """Rotas /competitions/{liga}/matches; rodada > 0 muda o placar de parte dos jogos"""
+    rng = random.Random(seed)
+    agora = datetime.now(timezone.utc).replace(microsecond=0)
+    rotas = {}
+    fixture_id = 500000
+    for liga in ligas:
+        partidas = []
+        for i in range(jogos_por_liga):
+            fixture_id += 1
+            status = rng.choices(STATUS_FOOTBALL_DATA, weights=[30, 20, 20, 5, 20, 5])[0]
+            gols_casa = rng.randint(0, 3) if status in ("IN_PLAY", "PAUSED", "FINISHED") else None
+            gols_fora = rng.randint(0, 3) if gols_casa is not None else None
+            # Entre rodadas do benchmark ~20% dos jogos em andamento marcam gol
+            if rodada and status == "IN_PLAY" and random.Random(fixture_id * 31 + rodada).random() < 0.2:
+                gols_casa += rodada
+            partidas.append({
+                "id": fixture_id,
+                "utcDate": agora.isoformat().replace("+00:00", "Z"),
+                "status": status,
+                "homeTeam": {"name": f"{liga} Casa {i}", "crest": f"https://crests.example/{liga}/{i}h.png"},
+                "awayTeam": {"name": f"{liga} Fora {i}", "crest": f"https://crests.example/{liga}/{i}a.png"},
+                "score": {"fullTime": {"home": gols_casa, "away": gols_fora}},
+            })
+        rotas[f"/v4/competitions/{liga}/matches"] = {
+            "competition": {"code": liga, "emblem": f"https://emblems.example/{liga}.png"},
+            "matches": partidas,
+        }
+    return rotas
+
+
+# ====================== MEDIÇÃO ======================
+class Resultados:
+    """Tempos medidos pelo benchmark por etapa (cada etapa pode ter vários casos)"""
+
+    def __init__(self):
+        self.casos = {}  # (etapa, caso) -> lista de ms
+
+    def medir(self, etapa, caso, funcao, repeticoes=1):
+        """Executa 'repeticoes' vezes e guarda os tempos; retorna o último resultado"""
+        resultado = None
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            resultado = funcao()
+            self.casos.setdefault((etapa, caso), []).append((time.perf_counter() - inicio) * 1000)
+        return resultado
+
+    def resumo(self):
+        """{"etapa/caso": {"mediana_ms", "min_ms", "max_ms", "n"}}"""
+        saida = {}
+        for (etapa, caso), tempos in self.casos.items():
+            ordenados = sorted(tempos)
+            saida[f"{etapa}/{caso}"] = {
+                "mediana_ms": ordenados[len(ordenados) // 2],
+                "min_ms": ordenados[0],
+                "max_ms": ordenados[-1],
+                "n": len(ordenados),
+            }
+        return saida
+
+
+def bench_app(app, args, resultados, pasta):
+    """Etapas load, normalize, score, optimize e filter do app"""
+    from PyQt5.QtWidgets import QApplication, QProgressBar
+
+    rotas = gerar_api_cartola(app, args)
+    if args.fixtures:
+        print(f"📼 {carregar_fixtures(args.fixtures, rotas)} rota(s) do Cartola vindas de {args.fixtures}")
+    cartola = RotasEstaticas(rotas)
+    if args.gravar_fixtures:
+        cartola.gravar(args.gravar_fixtures)
+
+    with ServidorStub(cartola, args.latencia) as servidor:
+        # ===== LOAD =====
+        pasta_cache = os.path.join(pasta, "cache")
+
+        def carga_fria():
+            shutil.rmtree(pasta_cache, ignore_errors=True)
+            return app.ClienteCartola(servidor.url, pasta_cache).carregar()
+
+        resultados.medir("load", "cache frio", carga_fria, args.rodadas)
+        cliente = app.ClienteCartola(servidor.url, pasta_cache)
+        dados = resultados.medir("load", "revalidação 304", cliente.carregar, args.rodadas)
+
+        def historico_frio():
+            historico = app.HistoricoRodadas(os.path.join(pasta, "historico"))
+            historico.limpar()
+            historico.atualizar(cliente, dados["status"])
+            return historico
+
+        historico = resultados.medir("load", f"histórico ({args.historico} rodadas)", historico_frio,
+                                     max(1, args.rodadas // 2))
+        print(f"🌐 Stub do Cartola: {servidor.requisicoes} requisições")
+
+    # ===== NORMALIZE / FILTER (janela sem tela) =====
+    class JanelaBenchmark(app.CartolaFCManager):
+        def carregar_dados(self):
+            """Sem a carga automática da API: o benchmark entrega os dados do stub"""
+
+    qt_app = QApplication.instance() or QApplication(sys.argv)
+    janela = JanelaBenchmark()
+    janela.cache_imagens.ativo = False
+    janela.historico = historico
+
+    def normalizar():
+        janela.progress = QProgressBar()
+        janela.dados_carregados(dados)
+
+    resultados.medir("normalize", "dados_carregados (com interface)", normalizar, args.rodadas)
+    resultados.medir("normalize", "TabelaAtletas + IndiceMercado",
+                     lambda: app.IndiceMercado(app.TabelaAtletas(janela.atletas, janela.partidas)), args.rodadas)
+
+    # ===== SCORE =====
+    escalador = app.EscaladorInteligente(janela.atletas, janela.clubes, janela.partidas, 100.0)
+    resultados.medir("score", "calcular_score (atleta a atleta)",
+                     lambda: [escalador.calcular_score(a) for a in janela.atletas], args.rodadas)
+    resultados.medir("score", "TabelaAtletas.scores_perfis (6 perfis)",
+                     lambda: janela.tabela.scores_perfis(app.PESOS_OPCOES), args.rodadas)
+
+    # ===== OPTIMIZE =====
+    for cartoletas in (80.0, 120.0):
+        escalador = app.EscaladorInteligente(janela.atletas, janela.clubes, janela.partidas,
+                                             cartoletas, janela.tabela)
+        resultados.medir("optimize", f"escalar_time C$ {cartoletas:.0f}", escalador.escalar_time, args.rodadas)
+
+    def escalar_na_janela():
+        janela.escalar_automaticamente()
+        qt_app.processEvents()
+
+    resultados.medir("optimize", "escalar_automaticamente (reservas + campo)", escalar_na_janela, args.rodadas)
+
+    # ===== FILTER =====
+    janela.chk_provaveis.setChecked(False)
+    cenarios = [("mercado inteiro", {})]
+    cenarios += [(f"posição {janela.combo_posicao.itemText(i)}", {"combo_posicao": i})
+                 for i in range(1, janela.combo_posicao.count())]
+    cenarios += [("busca por nome", {"txt_busca": "atleta 1"}), ("preço máx C$ 5", {"spin_preco_max": 5.0})]
+
+    def aplicar(filtros):
+        for widget in (janela.combo_posicao, janela.txt_busca, janela.spin_preco_max):
+            widget.blockSignals(True)
+        janela.combo_posicao.setCurrentIndex(filtros.get("combo_posicao", 0))
+        janela.txt_busca.setText(filtros.get("txt_busca", ""))
+        janela.spin_preco_max.setValue(filtros.get("spin_preco_max", janela.spin_preco_max.maximum()))
+        for widget in (janela.combo_posicao, janela.txt_busca, janela.spin_preco_max):
+            widget.blockSignals(False)
+
+    for nome, filtros in cenarios:
+        aplicar(filtros)
+        resultados.medir("filter", nome, janela.filtrar_mercado, args.rodadas)
+    janela.close()
+
+
+async def bench_sync(sync, args, resultados, ligas):
+    """Etapa sync: Football-Data -> game_rooms, contra stubs"""
+    import httpx
+
+    rotas = gerar_api_football_data(ligas, args.jogos, args.seed)
+    if args.fixtures:
+        print(f"📼 {carregar_fixtures(args.fixtures, rotas)} liga(s) da Football-Data vindas de {args.fixtures}")
+    football_data = RotasEstaticas(rotas)
+    if args.gravar_fixtures:
+        football_data.gravar(args.gravar_fixtures)
+    postgrest = PostgRESTStub()
+
+    async def medir(caso, corrotina_fabrica):
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultado = await corrotina_fabrica()
+        resultados.casos.setdefault(("sync", caso), []).append((time.perf_counter() - inicio) * 1000)
+        return resultado
+
+    with ServidorStub(football_data, args.latencia) as fd, ServidorStub(postgrest, args.latencia) as pg:
+        sync.FOOTBALL_DATA_URL = f"{fd.url}/v4"
+        sync.SUPABASE_URL = pg.url
+        # Cota alta: o benchmark mede o sincronizador, não a espera do free tier
+        limiter = sync.TokenBucket(rate_per_minute=10 ** 9)
+
+        async with httpx.AsyncClient() as client:
+            fixtures = []
+            for rodada in range(args.rodadas):
+                postgrest.linhas.clear()
+                fixtures = await medir(f"fetch_fixtures ({len(ligas)} ligas)",
+                                       lambda: sync.fetch_fixtures(client, None, limiter))
+                await medir(f"bulk_sync_to_supabase ({len(fixtures)} jogos, banco vazio)",
+                            lambda: sync.bulk_sync_to_supabase(client, fixtures))
+                await medir("bulk_sync_to_supabase diff (sem mudanças)",
+                            lambda: sync.bulk_sync_to_supabase(client, fixtures, diff=True))
+
+                # Mesmo dia, placares novos (sintéticos, mesmo com --fixtures): só os jogos alterados sobem
+                football_data.rotas.update(RotasEstaticas(
+                    gerar_api_football_data(ligas, args.jogos, args.seed, rodada + 1)).rotas)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    alterados = await sync.fetch_fixtures(client, None, limiter)
+                await medir("bulk_sync_to_supabase diff (placares novos)",
+                            lambda: sync.bulk_sync_to_supabase(client, alterados, diff=True))
+
+            postgrest.linhas.clear()
+            await medir(f"sync_to_supabase individual ({len(fixtures)} jogos)",
+                        lambda: sync.sync_to_supabase(client, fixtures))
+
+    print(f"🌐 Stub Football-Data: {fd.requisicoes} requisições | Stub PostgREST: {pg.requisicoes} requisições")
+
+
+def imprimir(resumo):
+    print(f"{'Etapa / caso':<58} | {'Mediana':>9} | {'Mín':>9} | {'Máx':>9}")
+    print("-" * 94)
+    for etapa in ETAPAS:
+        for chave, m in resumo.items():
+            if chave.split("/", 1)[0] == etapa:
+                print(f"{chave:<58} | {m['mediana_ms']:>7.1f}ms | {m['min_ms']:>7.1f}ms | {m['max_ms']:>7.1f}ms")
+
+
+def comparar(resumo, base, tolerancia):
+    """Casos mais lentos que a base além da tolerância: lista de (caso, base_ms, atual_ms)"""
+    regressoes = []
+    for chave, m in resumo.items():
+        anterior = base.get("casos", {}).get(chave)
+        if anterior is None:
+            continue
+        # Diferenças abaixo de 1ms são ruído de medição
+        if m["mediana_ms"] > anterior["mediana_ms"] * (1 + tolerancia) + 1.0:
+            regressoes.append((chave, anterior["mediana_ms"], m["mediana_ms"]))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline (app + sincronizador)")
+    parser.add_argument("--atletas", type=int, default=800)
+    parser.add_argument("--clubes", type=int, default=20)
+    parser.add_argument("--rodadas", type=int, default=5, help="repetições por medição")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--historico", type=int, default=10, help="rodadas encerradas servidas para o histórico")
+    parser.add_argument("--jogos", type=int, default=40, help="jogos por liga na Football-Data")
+    parser.add_argument("--latencia", type=float, default=0, help="latência artificial dos stubs (ms)")
+    parser.add_argument("--fixtures", help="pasta com respostas gravadas (ex.: atletas_mercado.json)")
+    parser.add_argument("--gravar-fixtures", help="salvar as respostas sintéticas nessa pasta")
+    parser.add_argument("--saida", help="salvar o resultado em JSON")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="folga antes de acusar regressão")
+    parser.add_argument("--sem-app", action="store_true", help="pular as etapas do app (só sync)")
+    parser.add_argument("--sem-sync", action="store_true", help="pular a etapa sync")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = carregar_app()
+    sys.path.insert(0, RAIZ_REPO)
+    import sync_live_rooms as sync
+
+    # Ganchos de perfil ligados só durante o benchmark
+    app.PERFIL.zerar()
+    app.PERFIL.ligar()
+    sync.PROFILER.reset()
+    sync.PROFILER.enable()
+
+    print("=" * 94)
+    print(f"⏱️ BENCHMARK PIPELINE - {args.atletas} atletas, {args.clubes} clubes, "
+          f"{args.historico} rodadas de histórico, {args.jogos} jogos x {len(sync.LIGAS)} ligas")
+    print("=" * 94)
+
+    resultados = Resultados()
+    pasta = tempfile.mkdtemp(prefix="cartola_bench_")
+    try:
+        if not args.sem_app:
+            bench_app(app, args, resultados, pasta)
+        if not args.sem_sync:
+            asyncio.run(bench_sync(sync, args, resultados, list(sync.LIGAS)))
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+    resumo = resultados.resumo()
+    print()
+    imprimir(resumo)
+    print()
+    print("⏱️ Ganchos do app (PERFIL)")
+    print(app.PERFIL.resumo())
+    print()
+    print("⏱️ Ganchos do sincronizador (PROFILER)")
+    print(sync.PROFILER.summary())
+
+    saida = {
+        "parametros": {k: v for k, v in vars(args).items() if k not in ("saida", "comparar")},
+        "casos": resumo,
+        "perfil_app": app.PERFIL.relatorio(),
+        "perfil_sync": sync.PROFILER.report(),
+    }
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            json.dump(saida, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultado salvo em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        regressoes = comparar(resumo, base, args.tolerancia)
+        print()
+        if not regressoes:
+            print(f"✅ Nenhuma regressão acima de {args.tolerancia:.0%} em relação a {args.comparar}")
+            return 0
+        print(f"❌ {len(regressoes)} regressão(ões) acima de {args.tolerancia:.0%}:")
+        for chave, antes, agora in regressoes:
+            print(f"   {chave}: {antes:.1f}ms -> {agora:.1f}ms ({agora / antes - 1:+.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+-- =========================================
+-- 017: Chave única das salas públicas por jogo
+-- =========================================
+-- O sync_live_rooms.py faz upsert em lote com on_conflict=fixture_id,private_code.
+-- Salas públicas têm private_code NULL: com NULLS NOT DISTINCT existe no máximo
+-- uma sala pública por fixture_id, e as salas privadas do mesmo jogo continuam
+-- permitidas (cada uma com seu código).
+
+-- 1. Unificar salas públicas duplicadas do mesmo jogo (mantém a mais antiga)
+--    As tabelas filhas têm ON DELETE CASCADE: membros, chat, odds, reações e
+--    convites das duplicadas são movidos para a sala mantida antes do DELETE
+CREATE TEMP TABLE salas_duplicadas AS
+SELECT id AS duplicada_id, mantida_id
+FROM (
+  SELECT id,
+         first_value(id) OVER (PARTITION BY fixture_id ORDER BY created_at NULLS LAST, id) AS mantida_id
+  FROM game_rooms
+  WHERE private_code IS NULL
+) salas
+WHERE id <> mantida_id;
+
+-- room_users tem UNIQUE(room_id, user_id): quem já está na sala mantida (ou em
+-- mais de uma duplicada) fica com uma linha só — a da sala mantida, senão a mais recente
+DELETE FROM room_users ru
+USING (
+  SELECT membro.id,
+         row_number() OVER (
+           PARTITION BY COALESCE(d.mantida_id, membro.room_id), membro.user_id
+           ORDER BY (d.duplicada_id IS NULL) DESC, membro.last_seen DESC NULLS LAST, membro.id
+         ) AS ordem
+  FROM room_users membro
+  LEFT JOIN salas_duplicadas d ON d.duplicada_id = membro.room_id
+  WHERE membro.room_id IN (SELECT duplicada_id FROM salas_duplicadas)
+     OR membro.room_id IN (SELECT mantida_id FROM salas_duplicadas)
+) repetidos
+WHERE ru.id = repetidos.id
+  AND repetidos.ordem > 1;
+
+UPDATE room_users t SET room_id = d.mantida_id
+FROM salas_duplicadas d WHERE t.room_id = d.duplicada_id;
+
+UPDATE room_messages t SET room_id = d.mantida_id
+FROM salas_duplicadas d WHERE t.room_id = d.duplicada_id;
+
+UPDATE user_odds t SET room_id = d.mantida_id
+FROM salas_duplicadas d WHERE t.room_id = d.duplicada_id;
+
+UPDATE room_reactions t SET room_id = d.mantida_id
+FROM salas_duplicadas d WHERE t.room_id = d.duplicada_id;
+
+UPDATE private_room_invites t SET room_id = d.mantida_id
+FROM salas_duplicadas d WHERE t.room_id = d.duplicada_id;
+
+-- Agora as duplicadas estão vazias: o CASCADE não apaga mais nada
+DELETE FROM game_rooms
+WHERE id IN (SELECT duplicada_id FROM salas_duplicadas);
+
+DROP TABLE salas_duplicadas;
+
+-- 2. Constraint usada pelo on_conflict do upsert
+DO $$
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'game_rooms_fixture_private_code_key') THEN
+    ALTER TABLE game_rooms
+    ADD CONSTRAINT game_rooms_fixture_private_code_key
+    UNIQUE NULLS NOT DISTINCT (fixture_id, private_code);
+  END IF;
+END $$;
+
+-- 3. Aceitar jogos adiados/cancelados ('cancelled' no STATUS_MAP do sincronizador)
+--    Sem isso uma única partida adiada derruba o lote inteiro do upsert
+DO $$
+BEGIN
+  BEGIN
+    ALTER TABLE game_rooms DROP CONSTRAINT IF EXISTS game_rooms_status_check;
+  EXCEPTION WHEN OTHERS THEN
+    -- Ignorar se não existir
+  END;
+
+  ALTER TABLE game_rooms
+  ADD CONSTRAINT game_rooms_status_check
+  CHECK (status IN ('scheduled', 'live', 'halftime', 'finished', 'cancelled'));
+END $$;